@@ -4,11 +4,11 @@ import json
 import os
 import re
 import warnings
+from functools import lru_cache
 from functools import wraps
 
 from dynaconf.utils import extract_json_objects
 from dynaconf.utils import isnamedtupleinstance
-from dynaconf.utils import multi_replace
 from dynaconf.utils import recursively_evaluate_lazy_format
 from dynaconf.utils.boxing import DynaBox
 from dynaconf.utils.functional import empty
@@ -25,12 +25,38 @@ except ImportError:  # pragma: no cover
     jinja_env = None
 
 true_values = ("t", "true", "enabled", "1", "on", "yes", "True")
+_TRUE_SET = frozenset(value.lower() for value in true_values)
 false_values = ("f", "false", "disabled", "0", "off", "no", "False", "")
+_FALSE_SET = frozenset(false_values)
 
+_AUTO_CAST_ENV_CACHE: dict[str, bool] = {}
+"""maps raw `AUTO_CAST_FOR_DYNACONF` env values to the parsed flag"""
 
-KV_PATTERN = re.compile(r"([a-zA-Z0-9 ]*=[a-zA-Z0-9\- :]*)")
+
+KV_PATTERN = re.compile(
+    r" *([a-zA-Z0-9 ]*?) *= *([a-zA-Z0-9\- :]*?) *(?![a-zA-Z0-9\- :])"
+)
 """matches `a=b, c=d, e=f` used on `VALUE='@merge foo=bar'` variables."""
 
+_JSON_FIX_RE = re.compile(r'"(?:[^"\\]|\\.)*"|:\s*(True|False|None)\b')
+"""matches JSON strings or Python literals used as values on
+`@merge {"valid": True}`, strings are matched to be kept untouched."""
+
+_JSON_FIX_MAP = {"True": "true", "False": "false", "None": "null"}
+
+
+def _fix_json_literal(match):
+    literal = match.group(1)
+    if literal is None:
+        return match.group(0)
+    return ": " + _JSON_FIX_MAP[literal]
+
+
+def _normalize_json_literals(text):
+    """Replaces Python `True`, `False` and `None` values with their JSON
+    counterparts in a single pass, leaving quoted strings untouched."""
+    return _JSON_FIX_RE.sub(_fix_json_literal, text)
+
 
 class DynaconfParseError(Exception):
     """Error to raise when parsing @casts"""
@@ -98,34 +124,22 @@ class Merge(MetaValue):
             self.value = [self.value]
         elif isinstance(self.value, str):
             # @merge {"valid": "json"}
-            json_object = list(
-                extract_json_objects(
-                    multi_replace(
-                        self.value,
-                        {
-                            ": True": ": true",
-                            ":True": ": true",
-                            ": False": ": false",
-                            ":False": ": false",
-                            ": None": ": null",
-                            ":None": ": null",
-                        },
-                    )
-                )
+            json_objects = extract_json_objects(
+                _normalize_json_literals(self.value)
             )
-            if len(json_object) == 1:
-                self.value = json_object[0]
+            # only a single json object is accepted, stop at the second one
+            json_object = next(json_objects, empty)
+            if json_object is not empty and next(json_objects, empty) is empty:
+                self.value = json_object
             else:
                 matches = KV_PATTERN.findall(self.value)
                 # a=b, c=d
                 if matches:
                     self.value = {
-                        k.strip(): parse_conf_data(
+                        k: parse_conf_data(
                             v, tomlfy=True, box_settings=box_settings
                         )
-                        for k, v in (
-                            match.strip().split("=") for match in matches
-                        )
+                        for k, v in matches
                     }
                 elif "," in self.value:
                     # @merge foo,bar
@@ -149,12 +163,24 @@ class BaseFormatter:
         return str(self.token)
 
 
+_JINJA_TEMPLATE_CACHE_SIZE = 4096
+_JINJA_TEMPLATE_CACHE: dict = {}
+"""compiled jinja templates keyed by the `@jinja` source string"""
+
+
 def _jinja_formatter(value, **context):
     if jinja_env is None:  # pragma: no cover
         raise ImportError(
             "jinja2 must be installed to enable '@jinja' settings in dynaconf"
         )
-    return jinja_env.from_string(value).render(**context)
+    template = _JINJA_TEMPLATE_CACHE.get(value)
+    if template is None:
+        if len(_JINJA_TEMPLATE_CACHE) >= _JINJA_TEMPLATE_CACHE_SIZE:
+            # evict the oldest compiled template (FIFO)
+            _JINJA_TEMPLATE_CACHE.pop(next(iter(_JINJA_TEMPLATE_CACHE)), None)
+        template = jinja_env.from_string(value)
+        _JINJA_TEMPLATE_CACHE[value] = template
+    return template.render(**context)
 
 
 class Formatters:
@@ -168,6 +194,7 @@ class Lazy:
     """Holds data to format lazily."""
 
     _dynaconf_lazy_format = True
+    _validator_object = None
 
     def __init__(
         self, value=empty, formatter=Formatters.python_formatter, casting=None
@@ -179,13 +206,22 @@ class Lazy:
     @property
     def context(self):
         """Builds a context for formatting."""
-        return {"env": os.environ, "this": self.settings}
+        return {
+            "env": os.environ,
+            "this": self.settings,
+            "_validator_object": self._validator_object,
+        }
 
     def __call__(self, settings, validator_object=None):
         """LazyValue triggers format lazily."""
         self.settings = settings
-        self.context["_validator_object"] = validator_object
-        result = self.formatter(self.value, **self.context)
+        self._validator_object = validator_object
+        result = self.formatter(
+            self.value,
+            env=os.environ,
+            this=settings,
+            _validator_object=validator_object,
+        )
         if self.casting is not None:
             result = self.casting(result)
         return result
@@ -210,9 +246,12 @@ class Lazy:
 
 def try_to_encode(value, callback=str):
     """Tries to encode a value by verifying existence of `_dynaconf_encode`"""
+    encoder = getattr(value, "_dynaconf_encode", None)
+    if encoder is None:
+        return callback(value)
     try:
-        return value._dynaconf_encode()
-    except (AttributeError, TypeError):
+        return encoder()
+    except TypeError:  # e.g: unbound `_dynaconf_encode` on a class
         return callback(value)
 
 
@@ -239,10 +278,10 @@ converters = {
     if isinstance(value, Lazy)
     else float(value),
     "@bool": lambda value: value.set_casting(
-        lambda x: str(x).lower() in true_values
+        lambda x: str(x).lower() in _TRUE_SET
     )
     if isinstance(value, Lazy)
-    else str(value).lower() in true_values,
+    else str(value).lower() in _TRUE_SET,
     "@json": lambda value: value.set_casting(
         lambda x: json.loads(x.replace("'", '"'))
     )
@@ -266,14 +305,19 @@ converters = {
     "@empty": lambda value: empty,
 }
 
+_LAZY_TOKENS = ("@jinja", "@format")
+"""tokens that can be combined with a casting e.g: `@int @jinja {{...}}`"""
+
+
+_CONVERTER_TAKES_BOX = frozenset(("@reset", "@del", "@merge", "@merge_unique"))
+"""converters that must be called with the `box_settings` argument"""
+
 
 def get_converter(converter_key, value, box_settings):
     converter = converters[converter_key]
-    try:
-        converted_value = converter(value, box_settings=box_settings)
-    except TypeError:
-        converted_value = converter(value)
-    return converted_value
+    if converter_key in _CONVERTER_TAKES_BOX:
+        return converter(value, box_settings=box_settings)
+    return converter(value)
 
 
 def add_converter(converter_key, func):
@@ -281,19 +325,49 @@ def add_converter(converter_key, func):
     if not converter_key.startswith("@"):
         converter_key = f"@{converter_key}"
 
+    # the formatter is shared by every value parsed with this converter
+    formatter = BaseFormatter(lambda x, **_: x, converter_key)
     converters[converter_key] = wraps(func)(
         lambda value: value.set_casting(func)
         if isinstance(value, Lazy)
-        else Lazy(
-            value,
-            casting=func,
-            formatter=BaseFormatter(lambda x, **_: x, converter_key),
-        )
+        else Lazy(value, casting=func, formatter=formatter)
     )
 
 
+_TOML_INT_RE = re.compile(r"[+-]?(?:0|[1-9][0-9]*)")
+_TOML_FLOAT_RE = re.compile(
+    r"[+-]?(?:0|[1-9][0-9]*)\.[0-9]+(?:[eE][+-]?[0-9]+)?"
+)
+_TOML_ALPHA_VALUES = ("true", "false", "inf", "nan")
+"""the only TOML values that can start with a letter"""
+
+
+def _sniff_toml_scalar(data):
+    """Parses the common scalar cases without a full TOML parse.
+    Returns `empty` when `data` needs to be parsed by the TOML parser."""
+    if not data:
+        return data
+    if data == "true":
+        return True
+    if data == "false":
+        return False
+    if data[0].isalpha() and not data.startswith(_TOML_ALPHA_VALUES):
+        # a bare word is never a valid TOML value
+        return data
+    if _TOML_INT_RE.fullmatch(data):
+        return int(data)
+    if _TOML_FLOAT_RE.fullmatch(data):
+        return float(data)
+    return empty
+
+
 def parse_with_toml(data):
     """Uses TOML syntax to parse data"""
+    if isinstance(data, str):
+        value = _sniff_toml_scalar(data)
+        if value is not empty:
+            return value
+
     try:  # try tomllib first
         try:
             return tomllib.loads(f"key={data}")["key"]
@@ -312,6 +386,19 @@ def parse_with_toml(data):
         )
 
 
+def _env_auto_cast_enabled():
+    """Reads `AUTO_CAST_FOR_DYNACONF` from environment.
+    The environment is read on every call so changes are honored, only the
+    parsing of the raw value is cached."""
+    raw = os.environ.get("AUTO_CAST_FOR_DYNACONF", "true")
+    try:
+        return _AUTO_CAST_ENV_CACHE[raw]
+    except KeyError:
+        enabled = raw.lower() not in _FALSE_SET
+        _AUTO_CAST_ENV_CACHE[raw] = enabled
+        return enabled
+
+
 def _parse_conf_data(data, tomlfy=False, box_settings=None):
     """
     @int @bool @float @json (for lists and dicts)
@@ -329,67 +416,190 @@ def _parse_conf_data(data, tomlfy=False, box_settings=None):
 
     castenabled = box_settings.get("AUTO_CAST_FOR_DYNACONF", empty)
     if castenabled is empty:
-        castenabled = (
-            os.environ.get("AUTO_CAST_FOR_DYNACONF", "true").lower()
-            not in false_values
-        )
-
-    if (
-        castenabled
-        and data
-        and isinstance(data, str)
-        and data.startswith(tuple(converters.keys()))
-    ):
-        # Check combination token is used
-        comb_token = re.match(
-            f"^({'|'.join(converters.keys())}) @(jinja|format)",
-            data,
-        )
-        if comb_token:
-            tokens = comb_token.group(0)
-            converter_key_list = tokens.split(" ")
-            value = data.replace(tokens, "").strip()
-        else:
-            parts = data.partition(" ")
-            converter_key_list = [parts[0]]
-            value = parts[-1]
-
+        castenabled = _env_auto_cast_enabled()
+
+    # exact `str` only, the cache compares keys by equality and would give
+    # back a `str` subclass instance to other callers and vice versa
+    if type(data) is str and _is_pure_parse(data, tomlfy, castenabled):
+        return _parse_conf_scalar(data, tomlfy, bool(castenabled))
+
+    return _parse_conf_value(data, tomlfy, castenabled, box_settings)
+
+
+def _parse_conf_value(data, tomlfy, castenabled, box_settings):
+    """Applies the converters found on `data` or parses it as TOML"""
+    converter_key_list = None
+    if castenabled and isinstance(data, str) and data.startswith("@"):
+        head, _, value = data.partition(" ")
+        if head in converters:
+            converter_key_list = [head]
+            # Check combination token is used
+            lazy_token, _, lazy_value = value.partition(" ")
+            if lazy_token in _LAZY_TOKENS:
+                converter_key_list.append(lazy_token)
+                value = lazy_value.strip()
+
+    if converter_key_list:
         # Parse the converters iteratively
         for converter_key in converter_key_list[::-1]:
             value = get_converter(converter_key, value, box_settings)
     else:
         value = parse_with_toml(data) if tomlfy else data
 
-    if isinstance(value, dict):
+    if isinstance(value, dict) and not isinstance(value, DynaBox):
         value = DynaBox(value, box_settings=box_settings)
 
     return value
 
 
-def parse_conf_data(data, tomlfy=False, box_settings=None):
+_PURE_CONVERTERS = {
+    key: converters[key]
+    for key in (
+        "@str",
+        "@int",
+        "@float",
+        "@bool",
+        "@note",
+        "@comment",
+        "@null",
+        "@none",
+        "@empty",
+    )
+}
+"""builtin converters that give immutable values and ignore `box_settings`"""
+
+
+def _is_pure_parse(data, tomlfy, castenabled):
+    """Tells if parsing `data` string gives an immutable value without
+    depending on `box_settings`, so the result can be cached."""
+    if castenabled and data.startswith("@"):
+        head, _, value = data.partition(" ")
+        if head in converters:
+            return (
+                converters[head] is _PURE_CONVERTERS.get(head)
+                and value.partition(" ")[0] not in _LAZY_TOKENS
+            )
+    # TOML arrays and tables are mutable, plain strings need no parsing and
+    # bare words are already resolved by `_sniff_toml_scalar` without TOML
+    return (
+        tomlfy
+        and not data[:1].isalpha()
+        and data.lstrip()[:1] not in ("[", "{")
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_conf_scalar(data, tomlfy, castenabled):
+    """Cached `_parse_conf_value` for data accepted by `_is_pure_parse`"""
+    return _parse_conf_value(data, tomlfy, castenabled, {})
+
+
+_SEQUENCE = "sequence"
+_MAPPING = "mapping"
+_SCALAR = "scalar"
+_NAMEDTUPLE = "namedtuple"
+
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+
+_DISPATCH_CACHE_SIZE = 1024
+_DISPATCH_CACHE: dict = {
+    list: _SEQUENCE,
+    tuple: _SEQUENCE,
+    dict: _MAPPING,
+    DynaBox: _MAPPING,
+    **{scalar_type: _SCALAR for scalar_type in _SCALAR_TYPES},
+}
+"""types mapped to their kind, filled by `_kind_of` as new types are seen"""
+
+
+def _kind_of(data):
+    """Tells how `parse_conf_data` must handle `data`"""
+    data_type = type(data)
+    kind = _DISPATCH_CACHE.get(data_type)
+    if kind is not None:
+        return kind
 
     # fix for https://github.com/dynaconf/dynaconf/issues/595
     if isnamedtupleinstance(data):
+        kind = _NAMEDTUPLE
+    elif isinstance(data, (tuple, list)):
+        kind = _SEQUENCE
+    elif isinstance(data, (dict, DynaBox)):
+        kind = _MAPPING
+    else:
+        kind = _SCALAR
+
+    if len(_DISPATCH_CACHE) < _DISPATCH_CACHE_SIZE:
+        _DISPATCH_CACHE[data_type] = kind
+    return kind
+
+
+def _parse_container_iter(root, kind, tomlfy, box_settings):
+    """Parses nested sequences and mappings using an explicit stack.
+
+    Sequences are parsed into lists and mappings into dicts, each item is
+    parsed by `_parse_conf_data` and namedtuples are kept as they are.
+    Items are parsed depth first in document order, like a recursive walk.
+    Raises `DynaconfParseError` if a container is found inside itself.
+    """
+
+    def enter(parsed, data):
+        # a container can be shared by many keys but can not contain itself
+        if id(data) in on_path:
+            raise DynaconfParseError(
+                f"Cannot parse {type(data).__name__} that contains itself"
+            )
+        on_path.add(id(data))
+        is_sequence = isinstance(parsed, list)
+        items = enumerate(data) if is_sequence else data.items()
+        stack.append((parsed, data, is_sequence, iter(items)))
+
+    parsed_root = [] if kind is _SEQUENCE else {}
+    on_path = set()
+    stack = []
+    enter(parsed_root, root)
+    while stack:
+        parsed, data, is_sequence, items = stack[-1]
+        for key, item in items:
+            kind = _kind_of(item)
+            child = None
+            if kind is _SCALAR:
+                value = _parse_conf_data(
+                    item, tomlfy=tomlfy, box_settings=box_settings
+                )
+            elif kind is _NAMEDTUPLE:
+                value = item
+            else:
+                value = child = [] if kind is _SEQUENCE else {}
+
+            if is_sequence:
+                parsed.append(value)
+            else:
+                parsed[key] = value
+
+            if child is not None:
+                # parse the nested items before the next sibling
+                enter(child, item)
+                break
+        else:
+            # every item of `data` was parsed, leaving its path
+            stack.pop()
+            on_path.discard(id(data))
+
+    return parsed_root
+
+
+def parse_conf_data(data, tomlfy=False, box_settings=None):
+    kind = _kind_of(data)
+    if kind is _NAMEDTUPLE:
         return data
 
     # not enforced to not break backwards compatibility with custom loaders
     box_settings = box_settings or {}
 
-    if isinstance(data, (tuple, list)):
-        # recursively parse each sequence item
-        return [
-            parse_conf_data(item, tomlfy=tomlfy, box_settings=box_settings)
-            for item in data
-        ]
-
-    if isinstance(data, (dict, DynaBox)):
-        # recursively parse inner dict items
-        _parsed = {}
-        for k, v in data.items():
-            _parsed[k] = parse_conf_data(
-                v, tomlfy=tomlfy, box_settings=box_settings
-            )
-        return _parsed
+    if kind is not _SCALAR:
+        # parse each sequence item or inner dict item
+        return _parse_container_iter(data, kind, tomlfy, box_settings)
 
     # return parsed string value
     return _parse_conf_data(data, tomlfy=tomlfy, box_settings=box_settings)
@@ -19,14 +19,22 @@ from dynaconf.utils import missing
 from dynaconf.utils import object_merge
 from dynaconf.utils import trimmed_split
 from dynaconf.utils import upperfy
+from dynaconf.utils.boxing import DynaBox
 from dynaconf.utils.files import find_file
 from dynaconf.utils.files import get_local_filename
+from dynaconf.utils.parse_conf import add_converter
+from dynaconf.utils.parse_conf import BaseFormatter
+from dynaconf.utils.parse_conf import converters
+from dynaconf.utils.parse_conf import DynaconfParseError
 from dynaconf.utils.parse_conf import evaluate_lazy_format
 from dynaconf.utils.parse_conf import Formatters
 from dynaconf.utils.parse_conf import Lazy
 from dynaconf.utils.parse_conf import parse_conf_data
+from dynaconf.utils.parse_conf import parse_with_toml
 from dynaconf.utils.parse_conf import try_to_encode
 from dynaconf.utils.parse_conf import unparse_conf_data
+from dynaconf.vendor import tomllib
+from dynaconf.vendor.ruamel import yaml
 
 
 def test_isnamedtupleinstance():
@@ -185,6 +193,138 @@ def test_casting_json(settings):
     assert "bar" in res and res["bar"] == 1
 
 
+def test_add_converter_combined_with_lazy(settings, mocker):
+    mocker.patch.dict(converters)
+    add_converter("reversed", lambda value: str(value)[::-1])
+
+    res = parse_conf_data("@reversed abc")(settings)
+    assert res == "cba"
+
+    settings.set("value", "xyz")
+    res = parse_conf_data("@reversed @format {this.value}")(settings)
+    assert res == "zyx"
+
+    res = parse_conf_data("@reversed @jinja {{ this.value }}")(settings)
+    assert res == "zyx"
+
+
+def test_converter_added_to_dict(settings, mocker):
+    def upper(value):
+        if isinstance(value, Lazy):
+            return value.set_casting(str.upper)
+        return value.upper()
+
+    mocker.patch.dict(converters, {"@upper": upper})
+    assert parse_conf_data("@upper abc") == "ABC"
+
+    settings.set("value", "xyz")
+    res = parse_conf_data("@upper @format {this.value}")(settings)
+    assert res == "XYZ"
+
+
+def test_parse_shared_and_cyclic_containers():
+    shared = {"b": "@int 1"}
+    parsed = parse_conf_data({"x": shared, "y": [shared]}, box_settings={})
+    assert parsed == {"x": {"b": 1}, "y": [{"b": 1}]}
+    assert parsed["x"] is not parsed["y"][0]
+
+    data = yaml.safe_load("a: &x\n  b: 1\n  c: *x\n")
+    with pytest.raises(DynaconfParseError):
+        parse_conf_data(data, box_settings={})
+
+    data = {"a": [1]}
+    data["a"].append(data)
+    with pytest.raises(DynaconfParseError):
+        parse_conf_data(data, box_settings={})
+
+
+def test_parse_nested_containers_in_order(mocker):
+    seen = []
+
+    def record(value):
+        seen.append(value)
+        return value
+
+    mocker.patch.dict(converters, {"@record": record})
+    data = {
+        "a": ["@record 1", {"b": "@record 2"}, ["@record 3"]],
+        "c": "@record 4",
+        "d": {"e": ["@record 5"], "f": "@record 6"},
+        "g": ["@record 7"],
+    }
+    parse_conf_data(data, box_settings={})
+    assert seen == ["1", "2", "3", "4", "5", "6", "7"]
+
+    with pytest.raises(ValueError, match="int"):
+        parse_conf_data({"a": ["@int x"], "b": ["@float y"]}, box_settings={})
+
+
+def test_parse_flat_dict():
+    data = {"a": "@int 1", "b": "text", "c": 1.5, "d": None}
+    parsed = parse_conf_data(data, tomlfy=True, box_settings={})
+    assert parsed == {"a": 1, "b": "text", "c": 1.5, "d": None}
+    assert type(parsed) is dict and parsed is not data
+
+
+def test_parse_nested_containers():
+    Db = namedtuple("Db", ["host", "port"])
+    db = Db(host="localhost", port="@int 3306")
+    data = {
+        "a": ["@int 1", ("@float 1.5", {"b": "@bool on"}), db],
+        "c": {"d": ["1", "@json [2]"], "e": "text"},
+    }
+    assert parse_conf_data(data, tomlfy=True, box_settings={}) == {
+        "a": [1, [1.5, {"b": True}], db],
+        "c": {"d": [1, [2]], "e": "text"},
+    }
+
+    deep = "@int 1"
+    for _ in range(5000):
+        deep = [deep]
+    parsed = parse_conf_data(deep, box_settings={})
+    for _ in range(5000):
+        parsed = parsed[0]
+    assert parsed == 1
+
+
+def test_parse_cached_values_are_not_shared():
+    assert parse_conf_data("@int 42", box_settings={}) == 42
+    assert parse_conf_data("@int 42", box_settings={}) == 42
+
+    first = parse_conf_data("[1, 2]", tomlfy=True, box_settings={})
+    first.append(3)
+    assert parse_conf_data("[1, 2]", tomlfy=True, box_settings={}) == [1, 2]
+
+    first = parse_conf_data('@json {"a": 1}', box_settings={})
+    first["b"] = 2
+    assert parse_conf_data('@json {"a": 1}', box_settings={}) == {"a": 1}
+
+
+def test_converted_dynabox_is_not_boxed_again(mocker):
+    box = DynaBox({"a": 1})
+    mocker.patch.dict(converters, {"@box": lambda value: box})
+    assert parse_conf_data("@box foo", box_settings={}) is box
+
+    res = parse_conf_data('@json {"a": 1}', box_settings={})
+    assert isinstance(res, DynaBox) and res == {"a": 1}
+
+
+def test_parse_cache_keeps_str_subclasses():
+    class Tagged(str):
+        pass
+
+    for value in ("material", "@unknown token"):
+        tagged = Tagged(value)
+        assert type(parse_conf_data(value, tomlfy=True)) is str
+        assert parse_conf_data(tagged, tomlfy=True) is tagged
+        assert type(parse_conf_data(value, tomlfy=True)) is str
+
+
+def test_unknown_converter_token_is_not_parsed():
+    assert parse_conf_data("@integer 42", box_settings={}) == "@integer 42"
+    assert parse_conf_data("@ 42", box_settings={}) == "@ 42"
+
+
 def test_disable_cast(monkeypatch):
     # this casts for int
     assert parse_conf_data("@int 42", box_settings={}) == 42
@@ -225,6 +365,53 @@ def test_tomlfy(settings):
     ) == {"key": "value", "v": 1}
 
 
+@pytest.mark.parametrize(
+    "test_input",
+    [
+        "",
+        "0",
+        "-0",
+        "+5",
+        "42",
+        "007",
+        "99999999999999999999",
+        "1.5",
+        "-0.0",
+        "1.5e10",
+        "1e5",
+        "1.",
+        ".5",
+        "1_000",
+        "0x1F",
+        "true",
+        "false",
+        "True",
+        "False",
+        "inf",
+        "true # comment",
+        "material",
+        "host.com",
+        "t",
+        "yes",
+        "1979-05-27",
+        "07:32:00",
+        "'quoted'",
+        '"42"',
+        "[1, 2]",
+        "{a=1}",
+        "foo bar",
+        "٣",
+    ],
+)
+def test_tomlfy_matches_toml_parser(test_input):
+    try:
+        expected = tomllib.loads(f"key={test_input}")["key"]
+    except tomllib.TOMLDecodeError:
+        expected = test_input
+    result = parse_with_toml(test_input)
+    assert result == expected and type(result) is type(expected)
+
+
 @pytest.mark.parametrize("test_input", ["something=42"])
 def test_tomlfy_unparseable(test_input, settings):
     assert (
@@ -268,6 +455,44 @@ def test_meta_values(settings):
     assert "Del()" in repr(_del)
 
 
+def test_merge_json_with_python_literals(settings):
+    merge = parse_conf_data(
+        '@merge {"a": True, "b":False, "c":  None, "d": "None"}',
+        box_settings=settings,
+    )
+    assert merge.value == {"a": True, "b": False, "c": None, "d": "None"}
+
+    merge = parse_conf_data(
+        r'@merge {"a": "x: True", "b": "\"y\": None", "c": True}',
+        box_settings=settings,
+    )
+    assert merge.value == {"a": "x: True", "b": '"y": None', "c": True}
+
+
+def test_merge_key_value_pairs(settings):
+    merge = parse_conf_data(
+        "@merge name = Bruno, age=42,  city=Sao Paulo", box_settings=settings
+    )
+    assert merge.value == {"name": "Bruno", "age": 42, "city": "Sao Paulo"}
+
+
+@pytest.mark.parametrize(
+    "test_input,expected_calls",
+    [
+        ("@merge a=1, b=2", 0),
+        ("@merge foo,bar", 0),
+        ("@merge 1", 0),
+        ("@merge [1, 2]", 1),
+        ("@merge {a=1}", 1),
+        ('@merge {"a": 1}', 1),
+    ],
+)
+def test_merge_parses_toml_once(test_input, expected_calls, mocker):
+    loads = mocker.spy(tomllib, "loads")
+    parse_conf_data(test_input, box_settings={})
+    assert loads.call_count == expected_calls
+
+
 def test_merge_existing_list():
     existing = ["bruno", "karla"]
     object_merge(existing, existing)
@@ -385,6 +610,19 @@ def test_lazy_format_class():
     assert repr(value) == f"'@{value.formatter} {value.value}'"
 
 
+def test_lazy_format_context():
+    formatter = BaseFormatter(lambda value, **context: context, "ctx")
+    value = Lazy("foo", formatter=formatter)
+    settings = {"FOO": "foo"}
+    validator = object()
+
+    context = value(settings, validator_object=validator)
+    assert context["env"] is os.environ
+    assert context["this"] is settings
+    assert context["_validator_object"] is validator
+    assert value.context == context
+
+
 def test_evaluate_lazy_format_decorator(settings):
     class Settings:
         FOO = "foo"
@@ -413,6 +651,8 @@ def test_lazy_format_class_jinja():
     value = Lazy("{{this['FOO']}}/bar", formatter=Formatters.jinja_formatter)
     settings = {"FOO": "foo"}
     assert value(settings) == "foo/bar"
+    # compiled template is reused but rendered with the new context
+    assert value({"FOO": "other"}) == "other/bar"
 
 
 def test_evaluate_lazy_format_decorator_jinja(settings):
@@ -455,6 +695,8 @@ def test_lazy_format_is_json_serializable():
 def test_try_to_encode():
     value = Lazy("{this[FOO]}/bar")
     assert try_to_encode(value) == "@format {this[FOO]}/bar"
+    assert try_to_encode(42) == "42"
+    assert try_to_encode(Lazy, callback=repr) == repr(Lazy)
 
 
 def test_del_raises_on_unwrap(settings):